@@ -29,6 +29,7 @@ THE SOFTWARE.
 """
 
 import sys
+from types import MappingProxyType
 
 from .container import (
     ArrayContainer, ArrayContainerT, NotAnArrayContainerError, deserialize_container,
@@ -123,7 +124,7 @@ def _deprecated_acf():
     return PyOpenCLArrayContext(queue)
 
 
-_depr_name_to_replacement_and_obj = {
+_depr_name_to_replacement_and_obj = MappingProxyType({
         "get_container_context": (
             "get_container_context_opt",
             get_container_context_opt, 2022),
@@ -133,21 +134,21 @@ _depr_name_to_replacement_and_obj = {
         "_acf": ("<no replacement yet>", _deprecated_acf, 2022),
         "DeviceArray": ("Array", Array, 2023),
         "DeviceScalar": ("Scalar", Scalar, 2023),
-        }
+        })
 
 if sys.version_info >= (3, 7):
     def __getattr__(name):
-        replacement_and_obj = _depr_name_to_replacement_and_obj.get(name, None)
-        if replacement_and_obj is not None:
-            replacement, obj, year = replacement_and_obj
-            from warnings import warn
-            warn(f"'arraycontext.{name}' is deprecated. "
-                    f"Use '{replacement}' instead. "
-                    f"'arraycontext.{name}' will continue to work until {year}.",
-                    DeprecationWarning, stacklevel=2)
-            return obj
-        else:
+        replacement_and_obj = _depr_name_to_replacement_and_obj.get(name)
+        if replacement_and_obj is None:
             raise AttributeError(name)
+
+        replacement, obj, year = replacement_and_obj
+        from warnings import warn
+        warn(f"'arraycontext.{name}' is deprecated. "
+                f"Use '{replacement}' instead. "
+                f"'arraycontext.{name}' will continue to work until {year}.",
+                DeprecationWarning, stacklevel=2)
+        return obj
 else:
     FirstAxisIsElementsTag = _FirstAxisIsElementsTag
     _acf = _deprecated_acf
@@ -98,8 +98,10 @@ class EagerJAXArrayContext(ArrayContext):
         return jnp.empty(shape=shape, dtype=dtype)
 
     def zeros(self, shape, dtype):
-        import jax.numpy as jnp
-        return jnp.zeros(shape=shape, dtype=dtype)
+        from .fake_numpy import _get_jitted_zeros
+
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        return _get_jitted_zeros(shape, dtype)()
 
     def empty_like(self, ary):
         from warnings import warn
@@ -21,19 +21,146 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
-from functools import partial, reduce
+from functools import lru_cache, partial, reduce
 
+import jax
 import jax.numpy as jnp
 import numpy as np
 
-from arraycontext.container import NotAnArrayContainerError, serialize_container
+from pytools import memoize, memoize_method
+
+from arraycontext.container import (
+    NotAnArrayContainerError, is_array_container_type, serialize_container)
 from arraycontext.container.traversal import (
     rec_map_array_container, rec_map_reduce_array_container,
-    rec_multimap_array_container)
+    rec_multimap_array_container, rec_multimap_reduce_array_container)
 from arraycontext.fake_numpy import (
     BaseFakeNumpyLinalgNamespace, BaseFakeNumpyNamespace)
 
 
+# {{{ jitted kernels
+
+# NOTE: Calling into jax.numpy op-by-op pays the dispatch overhead for every
+# operation, so the kernels used by the reductions, the array creation and the
+# array manipulation routines below are jitted. Helpers that depend on static
+# arguments are memoized on them, so that the functions (and their compilation
+# caches) are shared across calls. Each cached function keeps its compiled
+# executables alive, so helpers keyed on shapes, which can take arbitrarily
+# many values, use a bounded cache.
+
+@memoize
+def _get_jitted_sum(axis, dtype):
+    return jax.jit(partial(jnp.sum, axis=axis, dtype=dtype))
+
+
+@memoize
+def _get_jitted_amin(axis):
+    return jax.jit(partial(jnp.amin, axis=axis))
+
+
+@memoize
+def _get_jitted_amax(axis):
+    return jax.jit(partial(jnp.amax, axis=axis))
+
+
+_jitted_vdot = jax.jit(jnp.vdot)
+_jitted_all = jax.jit(jnp.all)
+_jitted_any = jax.jit(jnp.any)
+
+
+@jax.jit
+def _jitted_stack_all(xs):
+    return jnp.all(jnp.stack(xs))
+
+
+@jax.jit
+def _jitted_stack_any(xs):
+    return jnp.any(jnp.stack(xs))
+
+
+@jax.jit
+def _jitted_all_equal(xs, ys):
+    return jnp.all(jnp.stack([jnp.all(jnp.equal(x, y)) for x, y in zip(xs, ys)]))
+
+
+@lru_cache(maxsize=256)
+def _get_jitted_zeros(shape, dtype):
+    return jax.jit(lambda: jnp.zeros(shape=shape, dtype=dtype))
+
+
+_jitted_full_like = jax.jit(jnp.full_like)
+
+
+@memoize
+def _get_stacker(axis):
+    return lambda *args: jnp.stack(args, axis=axis)
+
+
+@memoize
+def _get_jitted_ravel(order):
+    return jax.jit(
+        lambda *xs: tuple(jnp.ravel(x, order=order) for x in xs))
+
+
+@lru_cache(maxsize=256)
+def _get_jitted_broadcast_to(shape):
+    return jax.jit(
+        lambda *xs: tuple(jnp.broadcast_to(x, shape) for x in xs))
+
+
+@jax.jit
+def _jitted_where(leaves):
+    return tuple(jnp.where(c, t, e) for c, t, e in leaves)
+
+# }}}
+
+
+# {{{ jitted container mapping
+
+def _rec_map_array_container_jitted(jitted_func, ary):
+    """Applies *jitted_func* to all the leaves of *ary* in a single call.
+
+    :arg jitted_func: a function that takes the leaves of *ary* as positional
+        arguments and returns a :class:`tuple` of the mapped leaves.
+    """
+    leaves = []
+
+    def _gather(subary):
+        leaves.append(subary)
+        return subary
+
+    # NOTE: gathering and scattering use the same traversal, so the leaves
+    # are visited in the same order
+    rec_map_array_container(_gather, ary)
+
+    mapped_leaves = iter(jitted_func(*leaves) if leaves else ())
+    return rec_map_array_container(lambda _: next(mapped_leaves), ary)
+
+
+def _rec_multimap_array_container_jitted(jitted_func, *args):
+    r"""Applies *jitted_func* to all the corresponding leaves of *args* in a
+    single call.
+
+    :arg jitted_func: a function that takes a :class:`list` of :class:`tuple`\ s
+        of corresponding leaves of *args* and returns a :class:`tuple` of the
+        mapped leaves.
+    """
+    leaves = []
+
+    def _gather(*subarys):
+        leaves.append(subarys)
+        return subarys[0]
+
+    # NOTE: gathering and scattering use the same traversal, so the leaves
+    # are visited in the same order
+    rec_multimap_array_container(_gather, *args)
+
+    mapped_leaves = iter(jitted_func(leaves) if leaves else ())
+    return rec_multimap_array_container(lambda *_: next(mapped_leaves), *args)
+
+# }}}
+
+
 class EagerJAXFakeNumpyLinalgNamespace(BaseFakeNumpyLinalgNamespace):
     # Everything is implemented in the base class for now.
     pass
@@ -47,7 +174,16 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
         return EagerJAXFakeNumpyLinalgNamespace(self._array_context)
 
     def __getattr__(self, name):
-        return partial(rec_multimap_array_container, getattr(jnp, name))
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        func = partial(rec_multimap_array_container, getattr(jnp, name))
+
+        # NOTE: caching the wrapper in the instance dict means that subsequent
+        # lookups of *name* no longer go through __getattr__
+        object.__setattr__(self, name, func)
+
+        return func
 
     # NOTE: the order of these follows the order in numpy docs
     # NOTE: when adding a function here, also add it to `array_context.rst` docs!
@@ -78,7 +214,7 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
 
     def full_like(self, ary, fill_value):
         def _full_like(subary):
-            return jnp.full_like(subary, fill_value)
+            return _jitted_full_like(subary, fill_value)
 
         return self._array_context._rec_map_container(
             _full_like, ary, default_scalar=fill_value)
@@ -105,37 +241,39 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
                  " using order=C.")
             order = "C"
 
-        return rec_map_array_container(
-            lambda subary: jnp.ravel(subary, order=order), a)
+        return _rec_map_array_container_jitted(_get_jitted_ravel(order), a)
 
     def transpose(self, a, axes=None):
         return rec_multimap_array_container(jnp.transpose, a, axes)
 
     def broadcast_to(self, array, shape):
-        return rec_map_array_container(partial(jnp.broadcast_to, shape=shape), array)
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+
+        return _rec_map_array_container_jitted(
+            _get_jitted_broadcast_to(shape), array)
 
     def concatenate(self, arrays, axis=0):
         return rec_multimap_array_container(jnp.concatenate, arrays, axis)
 
     def stack(self, arrays, axis=0):
-        return rec_multimap_array_container(
-            lambda *args: jnp.stack(arrays=args, axis=axis),
-            *arrays)
+        arrays = list(arrays)
+        if all(isinstance(ary, jnp.ndarray) for ary in arrays):
+            return jnp.stack(arrays, axis=axis)
+
+        return rec_multimap_array_container(_get_stacker(axis), *arrays)
 
     # }}}
 
     # {{{ linear algebra
 
     def vdot(self, x, y, dtype=None):
-        from arraycontext import rec_multimap_reduce_array_container
-
         def _rec_vdot(ary1, ary2):
             common_dtype = np.result_type(ary1, ary2)
             if dtype not in (None, common_dtype):
                 raise NotImplementedError(
                     f"{type(self).__name__} cannot take dtype in vdot.")
 
-            return jnp.vdot(ary1, ary2)
+            return _jitted_vdot(ary1, ary2)
 
         return rec_multimap_reduce_array_container(sum, _rec_vdot, x, y)
 
@@ -145,37 +283,62 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
 
     def all(self, a):
         return rec_map_reduce_array_container(
-            partial(reduce, jnp.logical_and), jnp.all, a)
+            _jitted_stack_all, _jitted_all, a)
 
     def any(self, a):
         return rec_map_reduce_array_container(
-            partial(reduce, jnp.logical_or), jnp.any, a)
+            _jitted_stack_any, _jitted_any, a)
 
-    def array_equal(self, a, b):
+    @memoize_method
+    def _get_true_false_arys(self):
         actx = self._array_context
 
         # NOTE: not all backends support `bool` properly, so use `int8` instead
-        true = actx.from_numpy(np.int8(True))
-        false = actx.from_numpy(np.int8(False))
+        return actx.from_numpy(np.int8(True)), actx.from_numpy(np.int8(False))
 
-        def rec_equal(x, y):
-            if type(x) is not type(y):
-                return false
+    def array_equal(self, a, b):
+        true, false = self._get_true_false_arys()
 
-            try:
-                iterable = zip(serialize_container(x), serialize_container(y))
-            except NotAnArrayContainerError:
-                if x.shape != y.shape:
-                    return false
+        x_leaves = []
+        y_leaves = []
+
+        def rec_gather(x, y):
+            """Collects the leaves of *x* and *y* and returns *False* if their
+            structure (types, keys or shapes) differs.
+            """
+            if type(x) is not type(y):
+                return False
+
+            # NOTE: checking the type first avoids raising (and catching)
+            # NotAnArrayContainerError for every leaf array
+            if is_array_container_type(type(x)):
+                try:
+                    x_iterable = list(serialize_container(x))
+                except NotAnArrayContainerError:
+                    pass
                 else:
-                    return jnp.all(jnp.equal(x, y))
-            else:
-                return reduce(
-                        jnp.logical_and,
-                        [rec_equal(ix, iy) for (_, ix), (_, iy) in iterable],
-                        true)
+                    y_iterable = list(serialize_container(y))
+                    if len(x_iterable) != len(y_iterable):
+                        return False
+
+                    return all(
+                        kx == ky and rec_gather(ix, iy)
+                        for (kx, ix), (ky, iy) in zip(x_iterable, y_iterable))
+
+            if x.shape != y.shape:
+                return False
+
+            x_leaves.append(x)
+            y_leaves.append(y)
+            return True
+
+        if not rec_gather(a, b):
+            return false
+
+        if not x_leaves:
+            return true
 
-        return rec_equal(a, b)
+        return _jitted_all_equal(tuple(x_leaves), tuple(y_leaves))
 
     # }}}
 
@@ -184,18 +347,18 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
     def sum(self, a, axis=None, dtype=None):
         return rec_map_reduce_array_container(
             sum,
-            partial(jnp.sum, axis=axis, dtype=dtype),
+            _get_jitted_sum(axis, dtype),
             a)
 
     def amin(self, a, axis=None):
         return rec_map_reduce_array_container(
-                partial(reduce, jnp.minimum), partial(jnp.amin, axis=axis), a)
+                partial(reduce, jnp.minimum), _get_jitted_amin(axis), a)
 
     min = amin
 
     def amax(self, a, axis=None):
         return rec_map_reduce_array_container(
-                partial(reduce, jnp.maximum), partial(jnp.amax, axis=axis), a)
+                partial(reduce, jnp.maximum), _get_jitted_amax(axis), a)
 
     max = amax
 
@@ -204,6 +367,7 @@ class EagerJAXFakeNumpyNamespace(BaseFakeNumpyNamespace):
     # {{{ sorting, searching and counting
 
     def where(self, criterion, then, else_):
-        return rec_multimap_array_container(jnp.where, criterion, then, else_)
+        return _rec_multimap_array_container_jitted(
+            _jitted_where, criterion, then, else_)
 
     # }}}
@@ -6,17 +6,21 @@
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, FrozenSet, Optional, Tuple
+from typing import FrozenSet, Optional, Tuple, Type
 
 import numpy as np
 
 import pyopencl.array as cla
 from pytools import memoize
-from pytools.tag import Tag, Taggable, ToTagSetConvertible
+from pytools.tag import (
+    Tag, Taggable, ToTagSetConvertible, check_tag_uniqueness, normalize_tags)
 
 
 # {{{ utils
 
+_EMPTY_TAG_SET: FrozenSet[Tag] = frozenset()
+
+
 @dataclass(frozen=True, eq=True)
 class Axis(Taggable):
     """
@@ -29,25 +33,55 @@ class Axis(Taggable):
         return replace(self, tags=tags)
 
 
+_EMPTY_AXIS = Axis(_EMPTY_TAG_SET)
+
+
+def _normalize_tags(tags: ToTagSetConvertible) -> FrozenSet[Tag]:
+    if isinstance(tags, frozenset) and not tags:
+        return _EMPTY_TAG_SET
+    else:
+        return normalize_tags(tags)
+
+
 @memoize
-def _construct_untagged_axes(ndim: int) -> Tuple[Axis, ...]:
-    return tuple(Axis(frozenset()) for _ in range(ndim))
-
-
-def _unwrap_cl_array(ary: cla.Array) -> Dict[str, Any]:
-    return {
-        "shape": ary.shape,
-        "dtype": ary.dtype,
-        "allocator": ary.allocator,
-        "strides": ary.strides,
-        "data": ary.base_data,
-        "offset": ary.offset,
-        "events": ary.events,
-        "_context": ary.context,
-        "_queue": ary.queue,
-        "_size": ary.size,
-        "_fast": True,
-        }
+def _construct_untagged_axis_tags(ndim: int) -> Tuple[FrozenSet[Tag], ...]:
+    return (_EMPTY_TAG_SET,) * ndim
+
+
+def _wrap_cl_array(cls: Type["TaggableCLArray"],
+                   ary: cla.Array, *,
+                   axis_tags: Tuple[FrozenSet[Tag], ...],
+                   tags: FrozenSet[Tag],
+                   axes: Optional[Tuple[Axis, ...]] = None) -> "TaggableCLArray":
+    """Constructs an instance of *cls* that shares the data of *ary*, bypassing
+    the :class:`TaggableCLArray` constructor. If given, *axes* must match
+    *axis_tags*.
+    """
+    if __debug__:
+        if not isinstance(tags, frozenset):
+            raise TypeError("tags are not a frozenset")
+
+        if len(axis_tags) != ary.ndim:
+            raise ValueError("axes length does not match array dimension: "
+                             f"got {len(axis_tags)} axes for {ary.ndim}d array")
+
+    result = cls.__new__(cls)
+    cla.Array.__init__(result, None, ary.shape, ary.dtype,
+                       allocator=ary.allocator,
+                       data=ary.base_data,
+                       offset=ary.offset,
+                       strides=ary.strides,
+                       events=ary.events,
+                       _fast=True,
+                       _size=ary.size,
+                       _context=ary.context,
+                       _queue=ary.queue)
+
+    result.tags = tags
+    result._axis_tags = axis_tags
+    result._axes = axes
+
+    return result
 
 # }}}
 
@@ -64,7 +98,8 @@ class TaggableCLArray(cla.Array, Taggable):
     .. attribute:: axes
 
        A :class:`tuple` of instances of :class:`Axis`, with one :class:`Axis`
-       for each dimension of the array.
+       for each dimension of the array. The :class:`Axis` instances are
+       constructed from the per-axis tags on first access.
 
     .. attribute:: tags
 
@@ -72,10 +107,12 @@ class TaggableCLArray(cla.Array, Taggable):
         record application-specific metadata to drive the optimizations in
         :meth:`arraycontext.PyOpenCLArrayContext.transform_loopy_program`.
     """
+    __slots__ = ("tags", "_axis_tags", "_axes")
+
     def __init__(self, cq, shape, dtype, order="C", allocator=None,
                  data=None, offset=0, strides=None, events=None, _flags=None,
                  _fast=False, _size=None, _context=None, _queue=None,
-                 axes=None, tags=frozenset()):
+                 axes=None, tags=_EMPTY_TAG_SET):
 
         super().__init__(cq=cq, shape=shape, dtype=dtype,
                          order=order, allocator=allocator,
@@ -93,37 +130,70 @@ class TaggableCLArray(cla.Array, Taggable):
                 raise ValueError("axes length does not match array dimension: "
                                  f"got {len(axes)} axes for {self.ndim}d array")
 
+        self.tags = tags
+
+        # NOTE: the tags of each axis are stored directly and the Axis
+        # instances are only constructed on demand by the *axes* property
         if axes is None:
-            axes = _construct_untagged_axes(self.ndim)
+            self._axis_tags = _construct_untagged_axis_tags(self.ndim)
+            self._axes = None
+        else:
+            self._axis_tags = tuple(axis.tags for axis in axes)
+            self._axes = tuple(axes)
+
+    @property
+    def axes(self) -> Tuple[Axis, ...]:
+        if self._axes is None:
+            self._axes = tuple(
+                Axis(axis_tags) if axis_tags else _EMPTY_AXIS
+                for axis_tags in self._axis_tags)
+
+        return self._axes
+
+    @axes.setter
+    def axes(self, axes: Tuple[Axis, ...]) -> None:
+        if __debug__:
+            if len(axes) != self.ndim:
+                raise ValueError("axes length does not match array dimension: "
+                                 f"got {len(axes)} axes for {self.ndim}d array")
 
-        self.tags = tags
-        self.axes = axes
+        self._axis_tags = tuple(axis.tags for axis in axes)
+        self._axes = tuple(axes)
 
     def copy(self, queue=cla._copy_queue):
         ary = super().copy(queue=queue)
-        return type(self)(None, tags=self.tags, axes=self.axes,
-                          **_unwrap_cl_array(ary))
+        return _wrap_cl_array(type(self), ary,
+                              axis_tags=self._axis_tags, axes=self._axes,
+                              tags=self.tags)
 
     def _with_new_tags(self, tags: FrozenSet[Tag]) -> "TaggableCLArray":
-        return type(self)(None, tags=tags, axes=self.axes,
-                          **_unwrap_cl_array(self))
+        return _wrap_cl_array(type(self), self,
+                              axis_tags=self._axis_tags, axes=self._axes,
+                              tags=tags)
 
     def with_tagged_axis(self, iaxis: int,
                          tags: ToTagSetConvertible) -> "TaggableCLArray":
         """
         Returns a copy of *self* with *iaxis*-th axis tagged with *tags*.
         """
-        new_axes = (self.axes[:iaxis]
-                    + (self.axes[iaxis].tagged(tags),)
-                    + self.axes[iaxis+1:])
+        if not -self.ndim <= iaxis < self.ndim:
+            raise IndexError(f"axis {iaxis} is out of bounds for "
+                             f"{self.ndim}d array")
+
+        iaxis = iaxis % self.ndim
+        new_axis_tags = (
+            self._axis_tags[:iaxis]
+            + (check_tag_uniqueness(
+                _normalize_tags(tags) | self._axis_tags[iaxis]),)
+            + self._axis_tags[iaxis+1:])
 
-        return type(self)(None, tags=self.tags, axes=new_axes,
-                          **_unwrap_cl_array(self))
+        return _wrap_cl_array(type(self), self,
+                              axis_tags=new_axis_tags, tags=self.tags)
 
 
 def to_tagged_cl_array(ary: cla.Array,
                        axes: Optional[Tuple[Axis, ...]] = None,
-                       tags: FrozenSet[Tag] = frozenset()) -> TaggableCLArray:
+                       tags: FrozenSet[Tag] = _EMPTY_TAG_SET) -> TaggableCLArray:
     """
     Returns a :class:`TaggableCLArray` that is constructed from the data in
     *ary* along with the metadata from *axes* and *tags*. If *ary* is already a
@@ -138,8 +208,7 @@ def to_tagged_cl_array(ary: cla.Array,
         raise ValueError("axes length does not match array dimension: "
                          f"got {len(axes)} axes for {ary.ndim}d array")
 
-    from pytools.tag import normalize_tags
-    tags = normalize_tags(tags)
+    tags = _normalize_tags(tags)
 
     if isinstance(ary, TaggableCLArray):
         if axes is not None:
@@ -151,8 +220,14 @@ def to_tagged_cl_array(ary: cla.Array,
 
         return ary
     elif isinstance(ary, cla.Array):
-        return TaggableCLArray(None, tags=tags, axes=axes,
-                               **_unwrap_cl_array(ary))
+        if axes is None:
+            axis_tags = _construct_untagged_axis_tags(ary.ndim)
+        else:
+            axes = tuple(axes)
+            axis_tags = tuple(axis.tags for axis in axes)
+
+        return _wrap_cl_array(TaggableCLArray, ary,
+                              axis_tags=axis_tags, axes=axes, tags=tags)
     else:
         raise TypeError(f"unsupported array type: '{type(ary).__name__}'")
 
@@ -163,7 +238,7 @@ def to_tagged_cl_array(ary: cla.Array,
 
 def empty(queue, shape, dtype=float, *,
         axes: Optional[Tuple[Axis, ...]] = None,
-        tags: FrozenSet[Tag] = frozenset(),
+        tags: FrozenSet[Tag] = _EMPTY_TAG_SET,
         order: str = "C",
         allocator=None) -> TaggableCLArray:
     if dtype is not None:
@@ -177,7 +252,7 @@ def empty(queue, shape, dtype=float, *,
 
 def zeros(queue, shape, dtype=float, *,
         axes: Optional[Tuple[Axis, ...]] = None,
-        tags: FrozenSet[Tag] = frozenset(),
+        tags: FrozenSet[Tag] = _EMPTY_TAG_SET,
         order: str = "C",
         allocator=None) -> TaggableCLArray:
     result = empty(
@@ -190,7 +265,7 @@ def zeros(queue, shape, dtype=float, *,
 
 def to_device(queue, ary, *,
         axes: Optional[Tuple[Axis, ...]] = None,
-        tags: FrozenSet[Tag] = frozenset(),
+        tags: FrozenSet[Tag] = _EMPTY_TAG_SET,
         allocator=None):
     return to_tagged_cl_array(
         cla.to_device(queue, ary, allocator=allocator),
@@ -178,13 +178,22 @@ class PytatoFakeNumpyNamespace(LoopyBasedFakeNumpyNamespace):
                 return false
 
             try:
-                iterable = zip(serialize_container(x), serialize_container(y))
+                x_iterable = list(serialize_container(x))
             except NotAnArrayContainerError:
                 if x.shape != y.shape:
                     return false
                 else:
                     return pt.all(pt.equal(x, y))
             else:
+                y_iterable = list(serialize_container(y))
+                if len(x_iterable) != len(y_iterable):
+                    return false
+
+                if any(kx != ky
+                       for (kx, _), (ky, _) in zip(x_iterable, y_iterable)):
+                    return false
+
+                iterable = zip(x_iterable, y_iterable)
                 return reduce(
                         pt.logical_and,
                         [rec_equal(ix, iy) for (_, ix), (_, iy) in iterable],
@@ -62,10 +62,15 @@ class _DatawrapperToBoundPlaceholderMapper(CopyMapper):
         from pytato.codegen import _generate_name_for_temp
         name = _generate_name_for_temp(expr, self.vng, "_actx_dw")
         self.bound_arguments[name] = expr.data
+
+        shape = expr.shape
+        if not all(type(s) is int for s in shape):
+            shape = tuple(self.rec(s) if isinstance(s, Array) else s
+                          for s in shape)
+
         return make_placeholder(
                     name=name,
-                    shape=tuple(self.rec(s) if isinstance(s, Array) else s
-                                for s in expr.shape),
+                    shape=shape,
                     dtype=expr.dtype,
                     axes=expr.axes,
                     tags=expr.tags)
@@ -472,6 +472,75 @@ def test_actx_ravel(actx_factory):
     assert_close_to_numpy(actx, lambda _np, ary: _np.ravel(ary),
                           (rng.random(shape),))
 
+
+def test_actx_ravel_and_broadcast_to_in_containers(actx_factory):
+    actx = actx_factory()
+    rng = np.random.default_rng()
+
+    # {{{ ravel
+
+    leaves = [rng.random((2, 3)), rng.random((4,)), rng.random((3, 1, 2))]
+    result = actx.np.ravel(
+        make_obj_array([actx.from_numpy(leaf) for leaf in leaves]))
+
+    for result_leaf, leaf in zip(result, leaves):
+        np.testing.assert_allclose(actx.to_numpy(result_leaf), np.ravel(leaf))
+
+    # }}}
+
+    # {{{ broadcast_to
+
+    if not hasattr(actx.np, "broadcast_to"):
+        pytest.skip(f"'broadcast_to' not implemented on '{type(actx).__name__}'")
+
+    leaves = [rng.random((3,)), rng.random((1,)), rng.random((2, 3))]
+    ary = make_obj_array([actx.from_numpy(leaf) for leaf in leaves])
+
+    shapes = [(2, 3), (4, 2, 3)]
+    if isinstance(actx, EagerJAXArrayContext):
+        shapes.extend([[2, 3], (np.int64(2), 3)])
+
+    for shape in shapes:
+        result = actx.np.broadcast_to(ary, shape)
+
+        for result_leaf, leaf in zip(result, leaves):
+            np.testing.assert_allclose(
+                actx.to_numpy(result_leaf), np.broadcast_to(leaf, shape))
+
+    if isinstance(actx, EagerJAXArrayContext):
+        leaves = [rng.random((3,)), rng.random((1,))]
+        ary = make_obj_array([actx.from_numpy(leaf) for leaf in leaves])
+
+        for shape in [3, np.int64(3)]:
+            result = actx.np.broadcast_to(ary, shape)
+
+            for result_leaf, leaf in zip(result, leaves):
+                np.testing.assert_allclose(
+                    actx.to_numpy(result_leaf), np.broadcast_to(leaf, shape))
+
+    # }}}
+
+
+def test_actx_where_in_containers(actx_factory):
+    actx = actx_factory()
+    rng = np.random.default_rng()
+
+    leaves = [rng.random((2, 3)), rng.random((4,)), rng.random((3, 1, 2))]
+    ary = make_obj_array([actx.from_numpy(leaf) for leaf in leaves])
+    criterion = ary > 0.5
+
+    # container criterion, scalar then/else
+    result = actx.np.where(criterion, 1.0, -1.0)
+    for result_leaf, leaf in zip(result, leaves):
+        np.testing.assert_allclose(
+            actx.to_numpy(result_leaf), np.where(leaf > 0.5, 1.0, -1.0))
+
+    # container criterion and then, scalar else
+    result = actx.np.where(criterion, ary, 0.0)
+    for result_leaf, leaf in zip(result, leaves):
+        np.testing.assert_allclose(
+            actx.to_numpy(result_leaf), np.where(leaf > 0.5, leaf, 0.0))
+
 # }}}
 
 
@@ -700,6 +769,29 @@ def test_array_equal(actx_factory):
     ary_empty_copy = ary_empty.copy()
     assert actx.to_numpy(actx.np.array_equal(ary_empty, ary_empty_copy))
 
+    def make_obj_ary(ref_ary):
+        result = np.empty(ref_ary.shape[:-1], dtype=object)
+        for idx in np.ndindex(result.shape):
+            result[idx] = actx.from_numpy(ref_ary[idx])
+
+        return result
+
+    # Same size, different shapes
+    ref_ary = np.ones((2, 3, 4))
+    ref_ary_diff_shape = np.ones((3, 2, 4))
+    assert (
+        bool(actx.to_numpy(actx.np.array_equal(
+            make_obj_ary(ref_ary), make_obj_ary(ref_ary_diff_shape))))
+        == np.array_equal(ref_ary, ref_ary_diff_shape))
+
+    # Different lengths
+    ref_ary = np.ones((2, 4))
+    ref_ary_diff_len = np.ones((3, 4))
+    assert (
+        bool(actx.to_numpy(actx.np.array_equal(
+            make_obj_ary(ref_ary), make_obj_ary(ref_ary_diff_len))))
+        == np.array_equal(ref_ary, ref_ary_diff_len))
+
 
 # }}}
 
@@ -1533,6 +1625,56 @@ def test_taggable_cl_array_tags(actx_factory):
 
     # }}}
 
+    # {{{ test tagged axes with negative indices
+
+    axis_tagged_ary = tagged_ary.with_tagged_axis(-1, ElementwiseMapKernelTag())
+
+    assert len(axis_tagged_ary.axes) == axis_tagged_ary.ndim
+    assert axis_tagged_ary.axes[0].tags == frozenset()
+    assert axis_tagged_ary.axes[1].tags == frozenset((ElementwiseMapKernelTag(),))
+
+    with pytest.raises(IndexError):
+        tagged_ary.with_tagged_axis(-3, ElementwiseMapKernelTag())
+
+    # }}}
+
+    # {{{ test tagged axes
+
+    from arraycontext.impl.pyopencl.taggable_cl_array import Axis
+    axis_tagged_ary = (tagged_ary
+                       .with_tagged_axis(0, FirstAxisIsElementsTag())
+                       .with_tagged_axis(0, ElementwiseMapKernelTag()))
+
+    assert all(isinstance(axis, Axis) for axis in axis_tagged_ary.axes)
+    assert axis_tagged_ary.axes[0].tags == frozenset(
+        (FirstAxisIsElementsTag(), ElementwiseMapKernelTag())
+    )
+    assert axis_tagged_ary.axes[1].tags == frozenset()
+
+    axis_tagged_ary.axes = (Axis(frozenset()), Axis(frozenset()))
+    assert axis_tagged_ary.axes[0].tags == frozenset()
+    axis_tagged_ary = axis_tagged_ary.with_tagged_axis(1, ElementwiseMapKernelTag())
+    assert axis_tagged_ary.axes[1] == Axis(frozenset((ElementwiseMapKernelTag(),)))
+
+    # }}}
+
+
+def test_taggable_cl_array_axis_pickling():
+    import pickle
+    from copy import deepcopy
+
+    from arraycontext import ElementwiseMapKernelTag
+    from arraycontext.impl.pyopencl.taggable_cl_array import Axis
+
+    axis = Axis(frozenset((ElementwiseMapKernelTag(),)))
+    assert axis.tags_of_type(ElementwiseMapKernelTag)
+
+    for new_axis in [pickle.loads(pickle.dumps(axis)), deepcopy(axis)]:
+        assert type(new_axis) is Axis
+        assert new_axis == axis
+        assert hash(new_axis) == hash(axis)
+        assert new_axis.tags_of_type(ElementwiseMapKernelTag)
+
 # }}}
 
 